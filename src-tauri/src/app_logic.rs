@@ -103,65 +103,56 @@ pub fn handle_menu_event(event_id: &str) -> MenuAction {
 
 #[cfg(test)]
 mod tests {
-    use std::sync::Mutex;
-
     use super::*;
+    use crate::keyboard::shared_test_emulator;
 
     /// Mock clipboard for testing
     struct MockClipboard {
-        content: Arc<Mutex<Result<Option<String>, String>>>,
+        content: Result<Option<String>, String>,
     }
 
     impl MockClipboard {
         fn new_with_content(content: &str) -> Self {
             Self {
-                content: Arc::new(Mutex::new(Ok(Some(content.to_string())))),
+                content: Ok(Some(content.to_string())),
             }
         }
 
         fn new_empty() -> Self {
-            Self {
-                content: Arc::new(Mutex::new(Ok(None))),
-            }
+            Self { content: Ok(None) }
         }
 
         fn new_with_error(error: &str) -> Self {
             Self {
-                content: Arc::new(Mutex::new(Err(error.to_string()))),
+                content: Err(error.to_string()),
             }
         }
     }
 
     impl ClipboardProvider for MockClipboard {
         fn get_content(&self) -> Result<Option<String>, String> {
-            self.content.lock().unwrap().clone()
+            self.content.clone()
         }
     }
 
     #[tokio::test]
     #[ignore = "Creates real keyboard emulator that can type on system - run with --ignored flag"]
     #[cfg(not(tarpaulin))]
-    async fn test_handle_paste_clipboard_with_content() {
-        let clipboard = MockClipboard::new_with_content("Hello, World!");
-        let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
-        let cancellation_flag = Arc::new(AtomicBool::new(false));
-
-        let result =
-            handle_paste_clipboard(&clipboard, &keyboard_emulator, cancellation_flag).await;
-        assert!(result.is_ok());
-    }
-
-    #[tokio::test]
-    #[ignore = "Creates real keyboard emulator that can type on system - run with --ignored flag"]
-    #[cfg(not(tarpaulin))]
-    async fn test_handle_paste_clipboard_empty() {
-        let clipboard = MockClipboard::new_empty();
-        let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
-        let cancellation_flag = Arc::new(AtomicBool::new(false));
-
-        let result =
-            handle_paste_clipboard(&clipboard, &keyboard_emulator, cancellation_flag).await;
-        assert!(result.is_ok());
+    async fn test_handle_paste_clipboard_succeeds() {
+        let long_text = "a".repeat(10000);
+        let cases = [
+            ("content", MockClipboard::new_with_content("Hello, World!")),
+            ("empty", MockClipboard::new_empty()),
+            ("long text", MockClipboard::new_with_content(&long_text)),
+        ];
+        let keyboard_emulator = shared_test_emulator();
+
+        for (label, clipboard) in &cases {
+            let cancellation_flag = Arc::new(AtomicBool::new(false));
+            let result =
+                handle_paste_clipboard(clipboard, &keyboard_emulator, cancellation_flag).await;
+            assert!(result.is_ok(), "{label}: {result:?}");
+        }
     }
 
     #[tokio::test]
@@ -169,7 +160,7 @@ mod tests {
     #[cfg(not(tarpaulin))]
     async fn test_handle_paste_clipboard_error() {
         let clipboard = MockClipboard::new_with_error("Clipboard access failed");
-        let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
+        let keyboard_emulator = shared_test_emulator();
         let cancellation_flag = Arc::new(AtomicBool::new(false));
 
         let result =
@@ -183,7 +174,7 @@ mod tests {
     #[cfg(not(tarpaulin))]
     async fn test_handle_paste_clipboard_with_cancellation() {
         let clipboard = MockClipboard::new_with_content("Test");
-        let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
+        let keyboard_emulator = shared_test_emulator();
         let cancellation_flag = Arc::new(AtomicBool::new(true)); // Pre-cancelled
 
         let result =
@@ -191,20 +182,6 @@ mod tests {
         assert!(result.is_ok()); // Should complete but text might be cut short
     }
 
-    #[tokio::test]
-    #[ignore = "Requires display connection for keyboard emulator"]
-    #[cfg(not(tarpaulin))]
-    async fn test_handle_paste_clipboard_with_very_long_text() {
-        let long_text = "a".repeat(10000);
-        let clipboard = MockClipboard::new_with_content(&long_text);
-        let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
-        let cancellation_flag = Arc::new(AtomicBool::new(false));
-
-        let result =
-            handle_paste_clipboard(&clipboard, &keyboard_emulator, cancellation_flag).await;
-        assert!(result.is_ok());
-    }
-
     #[test]
     fn test_create_menu_structure() {
         let menu = create_menu_structure();
@@ -241,24 +218,18 @@ mod tests {
     }
 
     #[test]
-    fn test_handle_menu_event_paste() {
-        assert_eq!(handle_menu_event("paste"), MenuAction::Paste);
-    }
-
-    #[test]
-    fn test_handle_menu_event_cancel_typing() {
-        assert_eq!(handle_menu_event("cancel_typing"), MenuAction::CancelTyping);
-    }
-
-    #[test]
-    fn test_handle_menu_event_quit() {
-        assert_eq!(handle_menu_event("quit"), MenuAction::Quit);
-    }
-
-    #[test]
-    fn test_handle_menu_event_unknown() {
-        assert_eq!(handle_menu_event("unknown"), MenuAction::None);
-        assert_eq!(handle_menu_event(""), MenuAction::None);
+    fn test_handle_menu_event() {
+        let cases = [
+            ("paste", MenuAction::Paste),
+            ("cancel_typing", MenuAction::CancelTyping),
+            ("quit", MenuAction::Quit),
+            ("unknown", MenuAction::None),
+            ("", MenuAction::None),
+        ];
+
+        for (event_id, expected) in cases {
+            assert_eq!(handle_menu_event(event_id), expected);
+        }
     }
 
     #[test]
@@ -34,6 +34,29 @@ pub enum KeyboardCommand {
     TypeText(String, Arc<AtomicBool>),
 }
 
+/// Number of characters typed before pausing between chunks
+const CHUNK_SIZE: usize = 200;
+
+/// Split text into the chunks typed between pauses
+/// Returns the chunk count and the chunks as slices of the original text
+fn typing_chunks(text: &str) -> (usize, impl Iterator<Item = &str> + '_) {
+    let chunk_count = text.chars().count().div_ceil(CHUNK_SIZE);
+    let mut rest = text;
+    let chunks = std::iter::from_fn(move || {
+        if rest.is_empty() {
+            return None;
+        }
+        let end = rest
+            .char_indices()
+            .nth(CHUNK_SIZE)
+            .map_or(rest.len(), |(index, _)| index);
+        let (chunk, tail) = rest.split_at(end);
+        rest = tail;
+        Some(chunk)
+    });
+    (chunk_count, chunks)
+}
+
 pub struct KeyboardEmulator {
     tx: mpsc::Sender<KeyboardCommand>,
 }
@@ -54,21 +77,21 @@ impl KeyboardEmulator {
 
                         debug!("Typing text with {typing_speed:?} speed");
 
-                        // Chunk text for better performance with long content
-                        const CHUNK_SIZE: usize = 200;
-                        let chars: Vec<char> = text.chars().collect();
-                        let chunks: Vec<String> = chars
-                            .chunks(CHUNK_SIZE)
-                            .map(|chunk| chunk.iter().collect::<String>())
-                            .collect();
+                        // Chunk text for better performance with long content.
+                        // Chunks borrow from the text so long content is not
+                        // copied into intermediate buffers first.
+                        let (chunk_count, chunks) = typing_chunks(&text);
+                        // Reused UTF-8 buffer so single characters are typed
+                        // without allocating a String each time
+                        let mut char_buf = [0u8; 4];
 
-                        for (i, chunk) in chunks.iter().enumerate() {
+                        for (i, chunk) in chunks.enumerate() {
                             // Check cancellation flag at the start of each chunk
                             if cancellation_flag.load(Ordering::Relaxed) {
                                 info!("Typing cancelled by user at chunk {i}");
                                 break;
                             }
-                            debug!("Processing chunk {} of {}", i + 1, chunks.len());
+                            debug!("Processing chunk {} of {}", i + 1, chunk_count);
 
                             // Type each character in the chunk
                             for (char_index, ch) in chunk.chars().enumerate() {
@@ -92,7 +115,7 @@ impl KeyboardEmulator {
                                         let _ = enigo.key(Key::Tab, enigo::Direction::Click);
                                     }
                                     _ => {
-                                        let _ = enigo.text(&ch.to_string());
+                                        let _ = enigo.text(ch.encode_utf8(&mut char_buf));
                                     }
                                 }
                                 std::thread::sleep(delay);
@@ -105,7 +128,7 @@ impl KeyboardEmulator {
                             }
 
                             // Add a small pause between chunks to avoid overwhelming the system
-                            if i < chunks.len() - 1 {
+                            if i < chunk_count - 1 {
                                 std::thread::sleep(Duration::from_millis(100));
                             }
                         }
@@ -134,6 +157,16 @@ impl KeyboardEmulator {
     }
 }
 
+/// Shared keyboard emulator for tests
+/// Avoids spawning a new worker thread and Enigo connection in every test
+#[cfg(test)]
+pub(crate) fn shared_test_emulator() -> Arc<KeyboardEmulator> {
+    static EMULATOR: std::sync::OnceLock<Arc<KeyboardEmulator>> = std::sync::OnceLock::new();
+    EMULATOR
+        .get_or_init(|| Arc::new(KeyboardEmulator::new().unwrap()))
+        .clone()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -151,35 +184,17 @@ mod tests {
     }
 
     #[test]
-    fn test_typing_speed_serialization() {
-        assert_eq!(
-            serde_json::to_string(&TypingSpeed::Slow).unwrap(),
-            "\"slow\""
-        );
-        assert_eq!(
-            serde_json::to_string(&TypingSpeed::Normal).unwrap(),
-            "\"normal\""
-        );
-        assert_eq!(
-            serde_json::to_string(&TypingSpeed::Fast).unwrap(),
-            "\"fast\""
-        );
-    }
-
-    #[test]
-    fn test_typing_speed_deserialization() {
-        assert_eq!(
-            serde_json::from_str::<TypingSpeed>("\"slow\"").unwrap(),
-            TypingSpeed::Slow
-        );
-        assert_eq!(
-            serde_json::from_str::<TypingSpeed>("\"normal\"").unwrap(),
-            TypingSpeed::Normal
-        );
-        assert_eq!(
-            serde_json::from_str::<TypingSpeed>("\"fast\"").unwrap(),
-            TypingSpeed::Fast
-        );
+    fn test_typing_speed_serde() {
+        let cases = [
+            (TypingSpeed::Slow, "\"slow\""),
+            (TypingSpeed::Normal, "\"normal\""),
+            (TypingSpeed::Fast, "\"fast\""),
+        ];
+
+        for (speed, json) in cases {
+            assert_eq!(serde_json::to_string(&speed).unwrap(), json);
+            assert_eq!(serde_json::from_str::<TypingSpeed>(json).unwrap(), speed);
+        }
     }
 
     #[test]
@@ -243,11 +258,9 @@ mod tests {
     #[test]
     fn test_text_chunking_logic() {
         let text = "a".repeat(500);
-        let chars: Vec<char> = text.chars().collect();
-        let chunks: Vec<String> = chars
-            .chunks(200)
-            .map(|chunk| chunk.iter().collect::<String>())
-            .collect();
+        let (chunk_count, chunks) = typing_chunks(&text);
+        let chunks: Vec<&str> = chunks.collect();
+        assert_eq!(chunk_count, 3);
         assert_eq!(chunks.len(), 3);
         assert_eq!(chunks[0].len(), 200);
         assert_eq!(chunks[1].len(), 200);
@@ -256,23 +269,17 @@ mod tests {
 
     #[test]
     fn test_empty_text_chunking() {
-        let text = "";
-        let chars: Vec<char> = text.chars().collect();
-        let chunks: Vec<String> = chars
-            .chunks(200)
-            .map(|chunk| chunk.iter().collect::<String>())
-            .collect();
+        let (chunk_count, chunks) = typing_chunks("");
+        let chunks: Vec<&str> = chunks.collect();
+        assert_eq!(chunk_count, 0);
         assert_eq!(chunks.len(), 0);
     }
 
     #[test]
     fn test_single_char_chunking() {
-        let text = "a";
-        let chars: Vec<char> = text.chars().collect();
-        let chunks: Vec<String> = chars
-            .chunks(200)
-            .map(|chunk| chunk.iter().collect::<String>())
-            .collect();
+        let (chunk_count, chunks) = typing_chunks("a");
+        let chunks: Vec<&str> = chunks.collect();
+        assert_eq!(chunk_count, 1);
         assert_eq!(chunks.len(), 1);
         assert_eq!(chunks[0], "a");
     }
@@ -280,11 +287,9 @@ mod tests {
     #[test]
     fn test_exact_chunk_size_text() {
         let text = "a".repeat(200);
-        let chars: Vec<char> = text.chars().collect();
-        let chunks: Vec<String> = chars
-            .chunks(200)
-            .map(|chunk| chunk.iter().collect::<String>())
-            .collect();
+        let (chunk_count, chunks) = typing_chunks(&text);
+        let chunks: Vec<&str> = chunks.collect();
+        assert_eq!(chunk_count, 1);
         assert_eq!(chunks.len(), 1);
         assert_eq!(chunks[0].len(), 200);
     }
@@ -301,11 +306,9 @@ mod tests {
     #[test]
     fn test_unicode_text_chunking() {
         let text = "😀🎉".repeat(100);
-        let chars: Vec<char> = text.chars().collect();
-        let chunks: Vec<String> = chars
-            .chunks(200)
-            .map(|chunk| chunk.iter().collect::<String>())
-            .collect();
+        let (chunk_count, chunks) = typing_chunks(&text);
+        let chunks: Vec<&str> = chunks.collect();
+        assert_eq!(chunk_count, 1);
         assert_eq!(chunks.len(), 1);
         assert_eq!(chunks[0].chars().count(), 200);
     }
@@ -402,16 +405,20 @@ mod tests {
 
     #[test]
     fn test_long_text_with_special_chars() {
-        let text = "Line1\nLine2\tTab\nLine3".repeat(50);
-        let chars: Vec<char> = text.chars().collect();
-        let chunks: Vec<String> = chars
-            .chunks(200)
-            .map(|chunk| chunk.iter().collect::<String>())
-            .collect();
+        let text = "Line1\nLine2\tTab\n😀".repeat(40);
+        let (chunk_count, chunks) = typing_chunks(&text);
+        let chunks: Vec<&str> = chunks.collect();
+
+        // 680 characters split into three full chunks and a partial one
+        assert_eq!(chunk_count, 4);
+        assert_eq!(chunks.len(), chunk_count);
+        assert!(chunks[..3].iter().all(|chunk| chunk.chars().count() == 200));
+        assert_eq!(chunks[3].chars().count(), 80);
 
         // Verify chunks maintain special characters
-        let all_text: String = chunks.join("");
-        assert_eq!(all_text, text);
+        assert!(chunks.iter().any(|chunk| chunk.contains('\n')));
+        assert!(chunks.iter().any(|chunk| chunk.contains('\t')));
+        assert_eq!(chunks.concat(), text);
     }
 
     #[test]
@@ -433,7 +440,6 @@ mod tests {
 
         // Spawn a thread that sets the flag
         let handle = std::thread::spawn(move || {
-            std::thread::sleep(Duration::from_millis(10));
             flag_clone.store(true, Ordering::Relaxed);
         });
 
@@ -199,7 +199,10 @@ mod tests {
     use tokio::sync::mpsc;
 
     use super::*;
-    use crate::{keyboard::TypingSpeed, tray::TrayManager};
+    use crate::{
+        keyboard::{shared_test_emulator, TypingSpeed},
+        tray::TrayManager,
+    };
 
     // Mock implementations for testing
     struct MockState {
@@ -208,7 +211,7 @@ mod tests {
 
     impl MockState {
         fn new() -> Self {
-            let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
+            let keyboard_emulator = shared_test_emulator();
 
             let app_state = AppState {
                 keyboard_emulator,
@@ -275,7 +278,7 @@ mod tests {
 
     #[tokio::test]
     async fn test_app_state_creation() {
-        let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
+        let keyboard_emulator = shared_test_emulator();
 
         let app_state = AppState {
             keyboard_emulator: keyboard_emulator.clone(),
@@ -309,7 +312,7 @@ mod tests {
 
     #[test]
     fn test_app_state_structure() {
-        let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
+        let keyboard_emulator = shared_test_emulator();
 
         let _app_state = AppState {
             keyboard_emulator: keyboard_emulator.clone(),
@@ -321,7 +324,7 @@ mod tests {
 
     #[test]
     fn test_app_state_cancellation_methods() {
-        let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
+        let keyboard_emulator = shared_test_emulator();
         let app_state = AppState {
             keyboard_emulator,
             is_typing_cancelled: Arc::new(AtomicBool::new(false)),
@@ -401,7 +404,7 @@ mod tests {
         // 4. Event listeners
 
         // Step 1: Keyboard emulator
-        let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
+        let keyboard_emulator = shared_test_emulator();
 
         // Step 2: Tray manager
         let _tray_manager = TrayManager::new();
@@ -478,7 +481,7 @@ mod tests {
     #[cfg(not(tarpaulin))]
     fn test_create_app_state() {
         // Test the create_app_state function
-        let keyboard_emulator = Arc::new(KeyboardEmulator::new().unwrap());
+        let keyboard_emulator = shared_test_emulator();
         let app_state = create_app_state(keyboard_emulator.clone());
 
         // Verify the app state holds the correct reference
@@ -23,8 +23,5 @@ mod tests {
         // This will fail to compile if pasta_tray_lib::run doesn't exist
         // Just checking that we can reference the function
         let _: fn() = pasta_tray_lib::run;
-
-        // If we got here, the function exists
-        assert!(true);
     }
 }
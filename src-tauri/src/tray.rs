@@ -186,14 +186,6 @@ mod tests {
         }
     }
 
-    #[test]
-    fn test_tray_tooltip() {
-        let tooltip = get_tray_tooltip();
-        assert_eq!(tooltip, "Pasta - Clipboard to Keyboard");
-        assert!(tooltip.contains("Pasta"));
-        assert!(tooltip.contains("Clipboard"));
-    }
-
     #[test]
     fn test_menu_event_ids() {
         // Test that all expected menu event IDs are defined
@@ -234,25 +226,15 @@ mod tests {
     }
 
     #[test]
-    fn test_handle_tray_icon_click_left() {
-        use tauri::tray::{MouseButton, MouseButtonState};
-
-        let action = handle_tray_icon_click(MouseButton::Left, MouseButtonState::Up);
-        assert_eq!(action, TrayIconAction::ShowMenu);
-    }
-
-    #[test]
-    fn test_handle_tray_icon_click_right() {
-        use tauri::tray::{MouseButton, MouseButtonState};
-
-        let action = handle_tray_icon_click(MouseButton::Right, MouseButtonState::Up);
-        assert_eq!(action, TrayIconAction::ShowMenu);
+    fn test_handle_tray_icon_click_shows_menu() {
+        for (label, button) in [("left", MouseButton::Left), ("right", MouseButton::Right)] {
+            let action = handle_tray_icon_click(button, MouseButtonState::Up);
+            assert_eq!(action, TrayIconAction::ShowMenu, "{label} button");
+        }
     }
 
     #[test]
     fn test_handle_tray_icon_click_other_states() {
-        use tauri::tray::{MouseButton, MouseButtonState};
-
         // Test button down state
         let action = handle_tray_icon_click(MouseButton::Left, MouseButtonState::Down);
         assert_eq!(action, TrayIconAction::None);